@@ -1,4 +1,11 @@
 """Python client for ZoomInfo API."""
-from .client import ZoomInfoClient
+from .client import CompanyFilters, ContactFilters, TokenBucket, ZoomInfoClient
 
-__all__ = ["ZoomInfoClient"]
+__all__ = ["CompanyFilters", "ContactFilters", "TokenBucket", "ZoomInfoClient"]
+
+try:
+    from .async_client import AsyncZoomInfoClient
+except ImportError:  # httpx is optional
+    pass
+else:
+    __all__.append("AsyncZoomInfoClient")
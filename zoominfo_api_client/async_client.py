@@ -0,0 +1,291 @@
+"""Asynchronous ZoomInfo API client using httpx.
+
+This client mirrors :class:`~zoominfo_api_client.client.ZoomInfoClient` so
+that many searches can be awaited concurrently, e.g. with
+:func:`asyncio.gather`.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from typing_extensions import Unpack
+
+from .client import (
+    CompanyFilters,
+    ContactFilters,
+    TokenBucket,
+    _COMPANY_PARAMS,
+    _CONTACT_PARAMS,
+    _JSON_HEADERS,
+    _POOL_SIZE,
+    _build_params,
+    _dumps,
+    _get_cached_token,
+    _invalidate_cached_token,
+    _loads,
+    _store_cached_token,
+    _token_cache_key,
+    _token_refresh_at,
+)
+
+
+class AsyncZoomInfoClient:
+    """Asynchronous client for interacting with the ZoomInfo API."""
+
+    __slots__ = (
+        "username",
+        "password",
+        "base_url",
+        "client",
+        "_owns_client",
+        "persist_token",
+        "token",
+        "_token_refresh_at",
+        "_cache_key",
+        "_auth_body",
+        "_auth_lock",
+        "_limiter",
+    )
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str = "https://api.zoominfo.com",
+        client: Optional[httpx.AsyncClient] = None,
+        persist_token: bool = False,
+        rate_limit_per_sec: Optional[float] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Parameters
+        ----------
+        username : str
+            ZoomInfo API username.
+        password : str
+            ZoomInfo API password.
+        base_url : str, optional
+            Base URL for the ZoomInfo API. Defaults to ``"https://api.zoominfo.com"``.
+        client : Optional[httpx.AsyncClient], optional
+            Pre-configured client to use for requests. If ``None``, an HTTP/2
+            :class:`httpx.AsyncClient` with a 32-connection pool is created,
+            which requires the ``h2`` package (``pip install "httpx[http2]"``).
+            Clients passed in are not closed by :meth:`aclose`.
+        persist_token : bool, optional
+            When true, JWT tokens are also cached in ``~/.zoominfo_jwt_cache``
+            so that other processes can reuse them until they expire.
+        rate_limit_per_sec : Optional[float], optional
+            When set, requests made by this client are spaced out so that no
+            more than this many are sent per second. The limit applies to
+            this instance only; pass a shared ``rate_limiter`` to keep
+            several clients on one account under the API's rate limit.
+        rate_limiter : Optional[TokenBucket], optional
+            Limiter to take a token from before each request, typically
+            shared between clients. Cannot be combined with
+            ``rate_limit_per_sec``. Either limiter also spaces out
+            ``/authenticate`` calls, which the API separately caps at one
+            request per second.
+
+        Raises
+        ------
+        ValueError
+            If both ``rate_limit_per_sec`` and ``rate_limiter`` are given.
+        """
+        if rate_limit_per_sec and rate_limiter is not None:
+            raise ValueError("rate_limit_per_sec cannot be combined with rate_limiter")
+        self.username = username
+        self.password = password
+        self.base_url = base_url.rstrip("/")
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_POOL_SIZE, max_keepalive_connections=_POOL_SIZE // 2
+            ),
+        )
+        self.persist_token = persist_token
+        self.token: Optional[str] = None
+        self._token_refresh_at = 0.0
+        self._cache_key = _token_cache_key(username, self.base_url)
+        self._auth_body = _dumps({"username": username, "password": password})
+        self._auth_lock = asyncio.Lock()
+        self._limiter = rate_limiter
+        if rate_limit_per_sec:
+            self._limiter = TokenBucket(rate_limit_per_sec)
+
+    async def __aenter__(self) -> "AsyncZoomInfoClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this client created it.
+
+        A client passed in by the caller is left open, since it may be shared
+        with other instances.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    # ------------------------------------------------------------------
+    # Authentication
+    # ------------------------------------------------------------------
+    async def authenticate(self) -> str:
+        """Authenticate and store a JWT token.
+
+        Returns
+        -------
+        str
+            JWT token returned by the API.
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            If the API request fails.
+        ValueError
+            If the JWT token is missing from the response.
+        """
+        url = f"{self.base_url}/authenticate"
+        response = await self._send(url, self._auth_body)
+        response.raise_for_status()
+        data = _loads(response.content)
+        self.token = data.get("jwt")
+        if not self.token:
+            raise ValueError("JWT token not found in authentication response")
+        self._token_refresh_at = _token_refresh_at(self.token)
+        _store_cached_token(
+            self._cache_key, self.token, self._token_refresh_at, self.persist_token
+        )
+        return self.token
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    async def _send(
+        self, url: str, body: bytes, token: Optional[str] = None
+    ) -> httpx.Response:
+        """POST a JSON ``body`` to ``url``, honoring the rate limiter.
+
+        The bearer ``token`` is sent as a per-request header rather than set
+        on the HTTP client, since clients may be shared.
+        """
+        if self._limiter is not None:
+            delay = self._limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        headers = _JSON_HEADERS
+        if token is not None:
+            headers = {**_JSON_HEADERS, "Authorization": f"Bearer {token}"}
+        return await self.client.post(url, content=body, headers=headers)
+
+    def _use_token(self, token: str, refresh_at: float) -> str:
+        """Make ``token`` the one sent with subsequent requests."""
+        if token != self.token:
+            self.token = token
+            self._token_refresh_at = refresh_at
+        return token
+
+    async def _ensure_token(self) -> str:
+        """Return a valid token, authenticating at most once concurrently.
+
+        Returns
+        -------
+        str
+            JWT token to use for the next request.
+        """
+        if self.token and time.time() < self._token_refresh_at:
+            return self.token
+        entry = _get_cached_token(self._cache_key, self.persist_token)
+        if entry is None:
+            async with self._auth_lock:
+                entry = _get_cached_token(self._cache_key, self.persist_token)
+                if entry is None:
+                    return await self.authenticate()
+        return self._use_token(*entry)
+
+    async def _refresh_token(self, rejected: str) -> str:
+        """Replace a token the API rejected, authenticating at most once.
+
+        Parameters
+        ----------
+        rejected : str
+            Token that received a ``401`` response.
+
+        Returns
+        -------
+        str
+            JWT token to retry the request with.
+        """
+        async with self._auth_lock:
+            entry = _get_cached_token(self._cache_key, self.persist_token)
+            if entry is None or entry[0] == rejected:
+                _invalidate_cached_token(self._cache_key, self.persist_token)
+                return await self.authenticate()
+        return self._use_token(*entry)
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Perform an authenticated POST request.
+
+        Parameters
+        ----------
+        path : str
+            API path appended to ``base_url`` (e.g., ``"/search/contact"``).
+        payload : Dict[str, Any]
+            JSON-serializable data to include in the request body.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parsed JSON response from the API.
+        """
+        token = await self._ensure_token()
+        url = f"{self.base_url}{path}"
+        body = _dumps(payload)
+        response = await self._send(url, body, token)
+        if response.status_code == 401:
+            token = await self._refresh_token(token)
+            response = await self._send(url, body, token)
+        response.raise_for_status()
+        return _loads(response.content)
+
+    # ------------------------------------------------------------------
+    # Search endpoints
+    # ------------------------------------------------------------------
+    async def search_contacts(
+        self, **filters: Unpack[ContactFilters]
+    ) -> Dict[str, Any]:
+        """Search for contacts using detailed filters.
+
+        Accepts the same keyword arguments as
+        :meth:`ZoomInfoClient.search_contacts`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parsed JSON response from the API.
+        """
+        return await self._post(
+            "/search/contact", _build_params(filters, _CONTACT_PARAMS)
+        )
+
+    async def search_companies(
+        self, **filters: Unpack[CompanyFilters]
+    ) -> Dict[str, Any]:
+        """Search for companies using detailed filters.
+
+        Accepts the same keyword arguments as
+        :meth:`ZoomInfoClient.search_companies`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parsed JSON response from the API.
+        """
+        return await self._post(
+            "/search/company", _build_params(filters, _COMPANY_PARAMS)
+        )
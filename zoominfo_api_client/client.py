@@ -5,20 +5,440 @@ for contacts and companies.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from typing_extensions import TypedDict, Unpack
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Tokens are refreshed this many seconds before their ``exp`` claim, or halfway
+# through their lifetime if that is sooner.
+_TOKEN_EXPIRY_BUFFER = 600
+# Lifetime assumed for tokens whose ``exp`` claim cannot be read.
+_DEFAULT_TOKEN_TTL = 3600
+_TOKEN_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".zoominfo_jwt_cache")
+
+# Process-wide JWT cache mapping a credential key to ``(token, refresh_at)``.
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Results per page requested by the paginating iterators when not given.
+_DEFAULT_RPP = 25
+
+# Connection pool size used for sessions created by the client.
+_POOL_SIZE = 32
+
+
+def _build_session() -> requests.Session:
+    """Return a session with a pooled, retrying adapter for HTTPS."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to a JSON request body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _canonical_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to JSON with sorted keys for use in cache keys."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
+def _token_cache_key(username: str, base_url: str) -> str:
+    """Return the cache key for a username and API base URL."""
+    return hashlib.sha256(f"{username}\0{base_url}".encode()).hexdigest()
+
+
+def _jwt_expiry(token: str) -> float:
+    """Return the ``exp`` claim of ``token``.
+
+    Tokens whose payload cannot be decoded are assumed to live for
+    ``_DEFAULT_TOKEN_TTL`` seconds.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        exp = None
+    if not isinstance(exp, (int, float)):
+        return time.time() + _DEFAULT_TOKEN_TTL
+    return float(exp)
+
+
+def _token_refresh_at(token: str) -> float:
+    """Return the time after which ``token`` should be replaced.
+
+    This is ``_TOKEN_EXPIRY_BUFFER`` seconds before its ``exp`` claim, capped
+    at half its remaining lifetime so short-lived tokens are still reused.
+    """
+    exp = _jwt_expiry(token)
+    return exp - min(_TOKEN_EXPIRY_BUFFER, max(exp - time.time(), 0.0) / 2)
+
+
+def _read_token_file() -> Dict[str, Tuple[str, float]]:
+    """Load the on-disk token cache, ignoring missing or corrupt files."""
+    try:
+        with open(_TOKEN_CACHE_FILE, "r", encoding="utf-8") as fh:
+            raw = json.load(fh)
+        return {key: (str(value[0]), float(value[1])) for key, value in raw.items()}
+    except (OSError, ValueError, TypeError, IndexError, AttributeError):
+        return {}
+
+
+def _write_token_file(entries: Dict[str, Tuple[str, float]]) -> None:
+    """Atomically replace the on-disk token cache with ``entries``."""
+    directory = os.path.dirname(_TOKEN_CACHE_FILE)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".zoominfo_jwt_")
+    except OSError:
+        return
+    try:
+        os.chmod(tmp_path, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({key: list(value) for key, value in entries.items()}, fh)
+        os.replace(tmp_path, _TOKEN_CACHE_FILE)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _get_cached_token(key: str, persist: bool = False) -> Optional[Tuple[str, float]]:
+    """Return ``(token, refresh_at)`` cached for ``key`` if still usable."""
+    now = time.time()
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is None and persist:
+            entry = _read_token_file().get(key)
+            if entry is not None:
+                _TOKEN_CACHE[key] = entry
+        if entry is None or entry[1] <= now:
+            return None
+        return entry
+
+
+def _store_cached_token(
+    key: str, token: str, refresh_at: float, persist: bool = False
+) -> None:
+    """Cache ``token`` under ``key`` until its refresh deadline."""
+    entry = (token, refresh_at)
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = entry
+        if persist:
+            entries = _read_token_file()
+            entries[key] = entry
+            _write_token_file(entries)
+
+
+def _invalidate_cached_token(key: str, persist: bool = False) -> None:
+    """Drop any cached token stored under ``key``."""
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.pop(key, None)
+        if persist:
+            entries = _read_token_file()
+            if entries.pop(key, None) is not None:
+                _write_token_file(entries)
+
+
+class TokenBucket:
+    """Thread-safe token bucket admitting ``rate`` requests per second.
+
+    Up to ``rate`` requests (at least one) may be made in a burst; callers
+    beyond that are told how long to wait so that the average rate holds.
+    One bucket can be shared by several clients through their
+    ``rate_limiter`` argument to apply a single limit across them.
+    """
+
+    __slots__ = ("rate", "capacity", "_tokens", "_last_refill", "_lock")
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be made."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+def _to_camel(name: str) -> str:
+    """Convert a snake_case parameter name to the API's camelCase."""
+    out = []
+    upper = False
+    for ch in name:
+        if ch == "_":
+            upper = True
+        else:
+            out.append(ch.upper() if upper else ch)
+            upper = False
+    return "".join(out)
+
+
+# Filters documented for each search method. Company-level filters are
+# accepted by both endpoints.
+class _CommonFilters(TypedDict, total=False):
+    """Company-level filters accepted by both search endpoints."""
+
+    company_ticker: Optional[List[str]]
+    company_description: Optional[str]
+    company_type: Optional[str]
+    address: Optional[str]
+    street: Optional[str]
+    zip_code: Optional[str]
+    state: Optional[str]
+    country: Optional[str]
+    continent: Optional[str]
+    company_id: Optional[str]
+    company_name: Optional[str]
+    company_website: Optional[str]
+    parent_id: Optional[str]
+    ultimate_parent_id: Optional[str]
+    zip_code_radius_miles: Optional[str]
+    hash_tag_string: Optional[str]
+    tech_attribute_tag_list: Optional[str]
+    sub_unit_types: Optional[str]
+    primary_industries_only: Optional[bool]
+    industry_codes: Optional[str]
+    industry_keywords: Optional[str]
+    sic_codes: Optional[str]
+    naics_codes: Optional[str]
+    revenue: Optional[str]
+    revenue_min: Optional[int]
+    revenue_max: Optional[int]
+    employee_range_min: Optional[str]
+    employee_range_max: Optional[str]
+    employee_count: Optional[str]
+    company_ranking: Optional[str]
+    metro_region: Optional[str]
+    location_search_type: Optional[str]
+    funding_amount_min: Optional[int]
+    funding_amount_max: Optional[int]
+    funding_start_date: Optional[str]
+    funding_end_date: Optional[str]
+    zoominfo_contacts_min: Optional[str]
+    zoominfo_contacts_max: Optional[str]
+    excluded_regions: Optional[str]
+    company_structure_included_sub_unit_types: Optional[str]
+    one_year_employee_growth_rate_min: Optional[str]
+    one_year_employee_growth_rate_max: Optional[str]
+    two_year_employee_growth_rate_min: Optional[str]
+    two_year_employee_growth_rate_max: Optional[str]
+    engagement_start_date: Optional[str]
+    engagement_end_date: Optional[str]
+    engagement_type: Optional[List[str]]
+    rpp: Optional[int]
+    page: Optional[int]
+    sort_by: Optional[str]
+    sort_order: Optional[str]
+
+
+class ContactFilters(_CommonFilters, total=False):
+    """Keyword arguments accepted by :meth:`ZoomInfoClient.search_contacts`."""
+
+    person_id: Optional[str]
+    email_address: Optional[str]
+    hashed_email: Optional[str]
+    full_name: Optional[str]
+    first_name: Optional[str]
+    middle_initial: Optional[str]
+    last_name: Optional[str]
+    job_title: Optional[str]
+    exclude_job_title: Optional[str]
+    management_level: Optional[str]
+    exclude_management_level: Optional[str]
+    board_member: Optional[str]
+    exclude_partial_profiles: Optional[bool]
+    executives_only: Optional[bool]
+    required_fields: Optional[str]
+    contact_accuracy_score_min: Optional[str]
+    contact_accuracy_score_max: Optional[str]
+    job_function: Optional[str]
+    last_updated_in_months: Optional[int]
+    has_been_notified: Optional[str]
+    company_past_or_present: Optional[str]
+    school: Optional[str]
+    degree: Optional[str]
+    location_company_id: Optional[List[str]]
+    last_updated_date_after: Optional[str]
+    valid_date_after: Optional[str]
+    phone: Optional[List[str]]
+    position_start_date_min: Optional[str]
+    position_start_date_max: Optional[str]
+    supplemental_email: Optional[List[str]]
+    web_references: Optional[List[str]]
+    buying_group: Optional[List[str]]
+    tech_skills: Optional[List[str]]
+    years_of_experience: Optional[str]
+    department: Optional[str]
+    exact_job_title: Optional[str]
+
+
+class CompanyFilters(_CommonFilters, total=False):
+    """Keyword arguments accepted by :meth:`ZoomInfoClient.search_companies`."""
+
+    marketing_department_budget_min: Optional[int]
+    marketing_department_budget_max: Optional[int]
+    finance_department_budget_min: Optional[int]
+    finance_department_budget_max: Optional[int]
+    it_department_budget_min: Optional[int]
+    it_department_budget_max: Optional[int]
+    hr_department_budget_min: Optional[int]
+    hr_department_budget_max: Optional[int]
+    certified: Optional[int]
+    exclude_defunct_companies: Optional[bool]
+    business_model: Optional[List[str]]
+
+
+_COMMON_PARAMS: Tuple[str, ...] = tuple(_CommonFilters.__annotations__)
+_CONTACT_ONLY: Tuple[str, ...] = tuple(
+    name for name in ContactFilters.__annotations__ if name not in _COMMON_PARAMS
+)
+_COMPANY_ONLY: Tuple[str, ...] = tuple(
+    name for name in CompanyFilters.__annotations__ if name not in _COMMON_PARAMS
+)
+_CONTACT_PARAMS: FrozenSet[str] = frozenset(_CONTACT_ONLY + _COMMON_PARAMS)
+_COMPANY_PARAMS: FrozenSet[str] = frozenset(_COMPANY_ONLY + _COMMON_PARAMS)
+
+# snake_case filter name -> camelCase API field, computed once at import.
+_CAMEL_MAP: Dict[str, str] = {
+    name: _to_camel(name) for name in _COMMON_PARAMS + _CONTACT_ONLY + _COMPANY_ONLY
+}
+
+
+def _build_params(values: Mapping[str, Any], allowed: FrozenSet[str]) -> Dict[str, Any]:
+    """Build a search payload from snake_case filter values.
+
+    Parameters
+    ----------
+    values : Mapping[str, Any]
+        Filter values keyed by argument name. ``None`` values are dropped.
+        Names in ``allowed`` are renamed to their camelCase API field; any
+        other name is sent verbatim. Only these supplied names are visited,
+        not every filter the endpoint accepts.
+    allowed : FrozenSet[str]
+        Documented filter names of the target endpoint.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Payload keyed by the API's field names.
+    """
+    if not values:
+        return {}
+    return {
+        _CAMEL_MAP[k] if k in allowed else k: v
+        for k, v in values.items()
+        if v is not None
+    }
 
 
 class ZoomInfoClient:
     """Client for interacting with the ZoomInfo API."""
 
+    __slots__ = (
+        "username",
+        "password",
+        "base_url",
+        "session",
+        "persist_token",
+        "token",
+        "_backend",
+        "_token_refresh_at",
+        "_cache_key",
+        "_auth_body",
+        "_auth_lock",
+        "_resp_cache",
+        "_resp_cache_lock",
+        "_limiter",
+    )
+
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _shared_session_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         username: str,
         password: str,
         base_url: str = "https://api.zoominfo.com",
         session: Optional[requests.Session] = None,
+        persist_token: bool = False,
+        cache_ttl: Optional[float] = None,
+        use_http2: bool = False,
+        use_shared_session: bool = False,
+        rate_limit_per_sec: Optional[float] = None,
+        rate_limiter: Optional[TokenBucket] = None,
     ) -> None:
         """Initialize the client.
 
@@ -32,13 +452,108 @@ class ZoomInfoClient:
             Base URL for the ZoomInfo API. Defaults to ``"https://api.zoominfo.com"``.
         session : Optional[requests.Session], optional
             Pre-configured session to use for requests. If ``None``, a new
-            :class:`requests.Session` is created.
+            :class:`requests.Session` is created with a 32-connection
+            keep-alive pool that retries ``429`` and ``5xx`` responses.
+            Sessions passed in are used as-is, so callers should mount their
+            own :class:`requests.adapters.HTTPAdapter` if they need pooling
+            or retries.
+        persist_token : bool, optional
+            When true, JWT tokens are also cached in ``~/.zoominfo_jwt_cache``
+            so that other processes can reuse them until they expire.
+        cache_ttl : Optional[float], optional
+            When set, search responses are cached in memory for this many
+            seconds (up to 1024 distinct requests) and identical searches are
+            answered without contacting the API. Cached responses are shared
+            between calls, so copy them before mutating. Requires the
+            ``cachetools`` package.
+        use_http2 : bool, optional
+            When true, requests are sent through an :class:`httpx.Client`
+            with HTTP/2 enabled instead of a :class:`requests.Session`, so
+            concurrent calls share one multiplexed connection. ``session`` is
+            then ``None``, and failed requests raise
+            :class:`httpx.HTTPStatusError`. Requires ``httpx[http2]``.
+        use_shared_session : bool, optional
+            When true and ``session`` is ``None``, use the process-wide
+            session returned by :meth:`get_shared_session` so that clients
+            reuse each other's open connections.
+        rate_limit_per_sec : Optional[float], optional
+            When set, requests made by this client are spaced out so that no
+            more than this many are sent per second. The limit applies to
+            this instance only; pass a shared ``rate_limiter`` to keep
+            several clients on one account under the API's rate limit.
+        rate_limiter : Optional[TokenBucket], optional
+            Limiter to take a token from before each request, typically
+            shared between clients. Cannot be combined with
+            ``rate_limit_per_sec``. Either limiter also spaces out
+            ``/authenticate`` calls, which the API separately caps at one
+            request per second.
+
+        Raises
+        ------
+        ValueError
+            If ``use_http2`` is combined with ``session`` or
+            ``use_shared_session``, or if both ``rate_limit_per_sec`` and
+            ``rate_limiter`` are given.
         """
+        if rate_limit_per_sec and rate_limiter is not None:
+            raise ValueError("rate_limit_per_sec cannot be combined with rate_limiter")
         self.username = username
         self.password = password
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self.session: Optional[requests.Session]
+        self._backend: Any
+        if use_http2:
+            if session is not None or use_shared_session:
+                raise ValueError(
+                    "use_http2 cannot be combined with session or use_shared_session"
+                )
+            import httpx
+
+            self.session = None
+            limits = httpx.Limits(
+                max_connections=_POOL_SIZE, max_keepalive_connections=_POOL_SIZE
+            )
+            self._backend = httpx.Client(
+                transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3)
+            )
+        else:
+            if session is None and use_shared_session:
+                session = self.get_shared_session()
+            self.session = session or _build_session()
+            self._backend = self.session
+        self.persist_token = persist_token
         self.token: Optional[str] = None
+        self._token_refresh_at = 0.0
+        self._cache_key = _token_cache_key(username, self.base_url)
+        self._auth_body = _dumps({"username": username, "password": password})
+        self._auth_lock = threading.Lock()
+        self._resp_cache: Optional[MutableMapping[Tuple[str, bytes], Any]] = None
+        if cache_ttl:
+            from cachetools import TTLCache
+
+            self._resp_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._resp_cache_lock = threading.Lock()
+        self._limiter = rate_limiter
+        if rate_limit_per_sec:
+            self._limiter = TokenBucket(rate_limit_per_sec)
+
+    @classmethod
+    def get_shared_session(cls) -> requests.Session:
+        """Return the session shared by clients created with ``use_shared_session``.
+
+        The session is created on first use with the same pooled, retrying
+        adapter as per-client sessions.
+
+        Returns
+        -------
+        requests.Session
+            Process-wide session.
+        """
+        if cls._shared_session is None:
+            with cls._shared_session_lock:
+                if cls._shared_session is None:
+                    cls._shared_session = _build_session()
+        return cls._shared_session
 
     # ------------------------------------------------------------------
     # Authentication
@@ -46,6 +561,9 @@ class ZoomInfoClient:
     def authenticate(self) -> str:
         """Authenticate and store a JWT token.
 
+        The token is added to the shared token cache so that other clients
+        using the same credentials can reuse it until it nears expiry.
+
         Returns
         -------
         str
@@ -54,23 +572,93 @@ class ZoomInfoClient:
         Raises
         ------
         requests.HTTPError
-            If the API request fails.
+            If the API request fails (:class:`httpx.HTTPStatusError` when
+            ``use_http2`` is set).
         ValueError
             If the JWT token is missing from the response.
         """
         url = f"{self.base_url}/authenticate"
-        response = self.session.post(url, json={"username": self.username, "password": self.password})
+        response = self._send(url, self._auth_body)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         self.token = data.get("jwt")
         if not self.token:
             raise ValueError("JWT token not found in authentication response")
-        self.session.headers["Authorization"] = f"Bearer {self.token}"
+        self._token_refresh_at = _token_refresh_at(self.token)
+        _store_cached_token(
+            self._cache_key, self.token, self._token_refresh_at, self.persist_token
+        )
         return self.token
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _send(self, url: str, body: bytes, token: Optional[str] = None) -> Any:
+        """POST a JSON ``body`` to ``url`` through the configured backend.
+
+        The bearer ``token`` is sent as a per-request header rather than set
+        on the session, since sessions may be shared between clients. Waits
+        for the rate limiter first when one is configured.
+        """
+        if self._limiter is not None:
+            self._limiter.acquire()
+        headers = _JSON_HEADERS
+        if token is not None:
+            headers = {**_JSON_HEADERS, "Authorization": f"Bearer {token}"}
+        if self.session is None:
+            return self._backend.post(url, content=body, headers=headers)
+        return self.session.post(url, data=body, headers=headers)
+
+    def _use_token(self, token: str, refresh_at: float) -> str:
+        """Make ``token`` the one sent with subsequent requests."""
+        if token != self.token:
+            self.token = token
+            self._token_refresh_at = refresh_at
+        return token
+
+    def _ensure_token(self) -> str:
+        """Return a valid token, reusing a cached one when possible.
+
+        The current token is reused without consulting the cache until its
+        refresh deadline, set by :func:`_token_refresh_at`, passes. When
+        several threads find no valid token at once, only one of them
+        authenticates; the others pick up the token it caches.
+
+        Returns
+        -------
+        str
+            JWT token to use for the next request.
+        """
+        if self.token and time.time() < self._token_refresh_at:
+            return self.token
+        entry = _get_cached_token(self._cache_key, self.persist_token)
+        if entry is None:
+            with self._auth_lock:
+                entry = _get_cached_token(self._cache_key, self.persist_token)
+                if entry is None:
+                    return self.authenticate()
+        return self._use_token(*entry)
+
+    def _refresh_token(self, rejected: str) -> str:
+        """Replace a token the API rejected, authenticating at most once.
+
+        Parameters
+        ----------
+        rejected : str
+            Token that received a ``401`` response.
+
+        Returns
+        -------
+        str
+            JWT token to retry the request with.
+        """
+        with self._auth_lock:
+            entry = _get_cached_token(self._cache_key, self.persist_token)
+            if entry is None or entry[0] == rejected:
+                _invalidate_cached_token(self._cache_key, self.persist_token)
+                return self.authenticate()
+        return self._use_token(*entry)
+
     def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Perform an authenticated POST request.
 
@@ -85,110 +673,136 @@ class ZoomInfoClient:
         -------
         Dict[str, Any]
             Parsed JSON response from the API.
+
+        Notes
+        -----
+        If the API rejects the token with ``401``, the cached token is
+        discarded and the request is retried once with a fresh token. When
+        response caching is enabled, identical requests made within
+        ``cache_ttl`` seconds return the cached response.
         """
-        if not self.token:
-            self.authenticate()
+        cache = self._resp_cache
+        cache_key = None
+        if cache is not None:
+            cache_key = (path, hashlib.sha256(_canonical_dumps(payload)).digest())
+            with self._resp_cache_lock:
+                cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        token = self._ensure_token()
         url = f"{self.base_url}{path}"
-        response = self.session.post(url, json=payload)
+        body = _dumps(payload)
+        response = self._send(url, body, token)
+        if response.status_code == 401:
+            token = self._refresh_token(token)
+            response = self._send(url, body, token)
         response.raise_for_status()
-        return response.json()
+        result = _loads(response.content)
+        if cache is not None and cache_key is not None:
+            with self._resp_cache_lock:
+                cache[cache_key] = result
+        return result
+
+    def _build_and_post(
+        self, path: str, filters: Mapping[str, Any], allowed: FrozenSet[str]
+    ) -> Dict[str, Any]:
+        """Translate search filters to API fields and POST them.
+
+        Parameters
+        ----------
+        path : str
+            API path appended to ``base_url`` (e.g., ``"/search/contact"``).
+        filters : Mapping[str, Any]
+            Keyword arguments given to the search method.
+        allowed : FrozenSet[str]
+            Documented filter names of the endpoint.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Parsed JSON response from the API.
+        """
+        return self._post(path, _build_params(filters, allowed))
+
+    def _iter_results(
+        self,
+        search: Callable[..., Dict[str, Any]],
+        filters: Dict[str, Any],
+        prefetch: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield records from consecutive result pages, fetching ahead.
+
+        Parameters
+        ----------
+        search : Callable[..., Dict[str, Any]]
+            Search method to call for each page.
+        filters : Dict[str, Any]
+            Keyword arguments for ``search``. ``page`` sets the first page
+            and ``rpp`` the page size.
+        prefetch : int
+            Number of pages requested ahead of the one being consumed.
+
+        Yields
+        ------
+        Dict[str, Any]
+            Individual records from each page's ``data`` list.
+
+        Notes
+        -----
+        The first page is fetched before any prefetching so that its
+        ``maxResults`` bounds the pages requested; the API rejects pages past
+        the last one with ``400``. Iteration also stops at a short page for
+        responses without ``maxResults``.
+        """
+        rpp = filters.pop("rpp", None) or _DEFAULT_RPP
+        first_page = filters.pop("page", None) or 1
+        response = search(page=first_page, rpp=rpp, **filters)
+        data = response.get("data") or []
+        max_results = response.get("maxResults")
+        last_page: Optional[int] = None
+        if isinstance(max_results, int):
+            last_page = -(-max_results // rpp)
+        if len(data) < rpp or (last_page is not None and first_page >= last_page):
+            yield from data
+            return
+        next_page = first_page + 1
+        pending: Deque[Tuple[int, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+
+            def submit() -> None:
+                nonlocal next_page
+                if last_page is not None and next_page > last_page:
+                    return
+                future = executor.submit(search, page=next_page, rpp=rpp, **filters)
+                pending.append((next_page, future))
+                next_page += 1
+
+            try:
+                for _ in range(prefetch):
+                    submit()
+                yield from data
+                while pending:
+                    page, future = pending.popleft()
+                    data = future.result().get("data") or []
+                    if len(data) < rpp or (last_page is not None and page >= last_page):
+                        yield from data
+                        return
+                    submit()
+                    yield from data
+            finally:
+                for _, future in pending:
+                    future.cancel()
 
     # ------------------------------------------------------------------
     # Search endpoints
     # ------------------------------------------------------------------
-    def search_contacts(
-        self,
-        person_id: Optional[str] = None,
-        email_address: Optional[str] = None,
-        hashed_email: Optional[str] = None,
-        full_name: Optional[str] = None,
-        first_name: Optional[str] = None,
-        middle_initial: Optional[str] = None,
-        last_name: Optional[str] = None,
-        job_title: Optional[str] = None,
-        exclude_job_title: Optional[str] = None,
-        management_level: Optional[str] = None,
-        exclude_management_level: Optional[str] = None,
-        board_member: Optional[str] = None,
-        exclude_partial_profiles: Optional[bool] = None,
-        executives_only: Optional[bool] = None,
-        required_fields: Optional[str] = None,
-        contact_accuracy_score_min: Optional[str] = None,
-        contact_accuracy_score_max: Optional[str] = None,
-        job_function: Optional[str] = None,
-        last_updated_in_months: Optional[int] = None,
-        has_been_notified: Optional[str] = None,
-        company_past_or_present: Optional[str] = None,
-        school: Optional[str] = None,
-        degree: Optional[str] = None,
-        location_company_id: Optional[List[str]] = None,
-        last_updated_date_after: Optional[str] = None,
-        valid_date_after: Optional[str] = None,
-        phone: Optional[List[str]] = None,
-        position_start_date_min: Optional[str] = None,
-        position_start_date_max: Optional[str] = None,
-        supplemental_email: Optional[List[str]] = None,
-        web_references: Optional[List[str]] = None,
-        buying_group: Optional[List[str]] = None,
-        tech_skills: Optional[List[str]] = None,
-        years_of_experience: Optional[str] = None,
-        department: Optional[str] = None,
-        exact_job_title: Optional[str] = None,
-        company_ticker: Optional[List[str]] = None,
-        company_description: Optional[str] = None,
-        company_type: Optional[str] = None,
-        address: Optional[str] = None,
-        street: Optional[str] = None,
-        zip_code: Optional[str] = None,
-        state: Optional[str] = None,
-        country: Optional[str] = None,
-        continent: Optional[str] = None,
-        company_id: Optional[str] = None,
-        company_name: Optional[str] = None,
-        company_website: Optional[str] = None,
-        parent_id: Optional[str] = None,
-        ultimate_parent_id: Optional[str] = None,
-        zip_code_radius_miles: Optional[str] = None,
-        hash_tag_string: Optional[str] = None,
-        tech_attribute_tag_list: Optional[str] = None,
-        sub_unit_types: Optional[str] = None,
-        primary_industries_only: Optional[bool] = None,
-        industry_codes: Optional[str] = None,
-        industry_keywords: Optional[str] = None,
-        sic_codes: Optional[str] = None,
-        naics_codes: Optional[str] = None,
-        revenue: Optional[str] = None,
-        revenue_min: Optional[int] = None,
-        revenue_max: Optional[int] = None,
-        employee_range_min: Optional[str] = None,
-        employee_range_max: Optional[str] = None,
-        employee_count: Optional[str] = None,
-        company_ranking: Optional[str] = None,
-        metro_region: Optional[str] = None,
-        location_search_type: Optional[str] = None,
-        funding_amount_min: Optional[int] = None,
-        funding_amount_max: Optional[int] = None,
-        funding_start_date: Optional[str] = None,
-        funding_end_date: Optional[str] = None,
-        zoominfo_contacts_min: Optional[str] = None,
-        zoominfo_contacts_max: Optional[str] = None,
-        excluded_regions: Optional[str] = None,
-        company_structure_included_sub_unit_types: Optional[str] = None,
-        one_year_employee_growth_rate_min: Optional[str] = None,
-        one_year_employee_growth_rate_max: Optional[str] = None,
-        two_year_employee_growth_rate_min: Optional[str] = None,
-        two_year_employee_growth_rate_max: Optional[str] = None,
-        engagement_start_date: Optional[str] = None,
-        engagement_end_date: Optional[str] = None,
-        engagement_type: Optional[List[str]] = None,
-        rpp: Optional[int] = None,
-        page: Optional[int] = None,
-        sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None,
-        **extra_filters: Any,
-    ) -> Dict[str, Any]:
+    def search_contacts(self, **filters: Unpack[ContactFilters]) -> Dict[str, Any]:
         """Search for contacts using detailed filters.
 
+        Filters are given as keyword arguments, typed by :class:`ContactFilters`.
+        Those listed below are sent under their camelCase API field name; any
+        other keyword is passed to the API verbatim.
+
         Parameters
         ----------
         person_id : Optional[str]
@@ -365,95 +979,21 @@ class ZoomInfoClient:
             Field name to sort results by.
         sort_order : Optional[str]
             Sort order (``asc`` or ``desc``).
-        **extra_filters : Any
-            Additional filters passed directly to the API.
 
         Returns
         -------
         Dict[str, Any]
             Parsed JSON response from the API.
         """
+        return self._build_and_post("/search/contact", filters, _CONTACT_PARAMS)
 
-        def to_camel(name: str) -> str:
-            parts = name.split("_")
-            return parts[0] + "".join(p.capitalize() for p in parts[1:])
-
-        params = {
-            to_camel(k): v
-            for k, v in locals().items()
-            if k not in {"self", "extra_filters"} and v is not None
-        }
-        params.update(extra_filters)
-        return self._post("/search/contact", params)
-
-    def search_companies(
-        self,
-        marketing_department_budget_min: Optional[int] = None,
-        marketing_department_budget_max: Optional[int] = None,
-        finance_department_budget_min: Optional[int] = None,
-        finance_department_budget_max: Optional[int] = None,
-        it_department_budget_min: Optional[int] = None,
-        it_department_budget_max: Optional[int] = None,
-        hr_department_budget_min: Optional[int] = None,
-        hr_department_budget_max: Optional[int] = None,
-        certified: Optional[int] = None,
-        exclude_defunct_companies: Optional[bool] = None,
-        company_ticker: Optional[List[str]] = None,
-        company_description: Optional[str] = None,
-        company_type: Optional[str] = None,
-        address: Optional[str] = None,
-        street: Optional[str] = None,
-        zip_code: Optional[str] = None,
-        state: Optional[str] = None,
-        country: Optional[str] = None,
-        continent: Optional[str] = None,
-        company_id: Optional[str] = None,
-        company_name: Optional[str] = None,
-        company_website: Optional[str] = None,
-        parent_id: Optional[str] = None,
-        ultimate_parent_id: Optional[str] = None,
-        zip_code_radius_miles: Optional[str] = None,
-        hash_tag_string: Optional[str] = None,
-        tech_attribute_tag_list: Optional[str] = None,
-        sub_unit_types: Optional[str] = None,
-        primary_industries_only: Optional[bool] = None,
-        industry_codes: Optional[str] = None,
-        industry_keywords: Optional[str] = None,
-        sic_codes: Optional[str] = None,
-        naics_codes: Optional[str] = None,
-        revenue: Optional[str] = None,
-        revenue_min: Optional[int] = None,
-        revenue_max: Optional[int] = None,
-        employee_range_min: Optional[str] = None,
-        employee_range_max: Optional[str] = None,
-        employee_count: Optional[str] = None,
-        company_ranking: Optional[str] = None,
-        metro_region: Optional[str] = None,
-        location_search_type: Optional[str] = None,
-        funding_amount_min: Optional[int] = None,
-        funding_amount_max: Optional[int] = None,
-        funding_start_date: Optional[str] = None,
-        funding_end_date: Optional[str] = None,
-        zoominfo_contacts_min: Optional[str] = None,
-        zoominfo_contacts_max: Optional[str] = None,
-        excluded_regions: Optional[str] = None,
-        company_structure_included_sub_unit_types: Optional[str] = None,
-        one_year_employee_growth_rate_min: Optional[str] = None,
-        one_year_employee_growth_rate_max: Optional[str] = None,
-        two_year_employee_growth_rate_min: Optional[str] = None,
-        two_year_employee_growth_rate_max: Optional[str] = None,
-        business_model: Optional[List[str]] = None,
-        engagement_start_date: Optional[str] = None,
-        engagement_end_date: Optional[str] = None,
-        engagement_type: Optional[List[str]] = None,
-        rpp: Optional[int] = None,
-        page: Optional[int] = None,
-        sort_by: Optional[str] = None,
-        sort_order: Optional[str] = None,
-        **extra_filters: Any,
-    ) -> Dict[str, Any]:
+    def search_companies(self, **filters: Unpack[CompanyFilters]) -> Dict[str, Any]:
         """Search for companies using detailed filters.
 
+        Filters are given as keyword arguments, typed by :class:`CompanyFilters`.
+        Those listed below are sent under their camelCase API field name; any
+        other keyword is passed to the API verbatim.
+
         Parameters
         ----------
         marketing_department_budget_min : Optional[int]
@@ -580,24 +1120,77 @@ class ZoomInfoClient:
             Field name to sort results by.
         sort_order : Optional[str]
             Sort order (``asc`` or ``desc``).
-        **extra_filters : Any
-            Additional filters passed directly to the API.
 
         Returns
         -------
         Dict[str, Any]
             Parsed JSON response from the API.
         """
+        return self._build_and_post("/search/company", filters, _COMPANY_PARAMS)
+
+    # ------------------------------------------------------------------
+    # Pagination
+    # ------------------------------------------------------------------
+    def iter_contacts(
+        self, prefetch: int = 2, **filters: Unpack[ContactFilters]
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all contacts matching the filters.
+
+        Pages are requested in a background thread pool so that up to
+        ``prefetch`` pages are in flight while the current one is consumed.
+        Iteration stops at the first page with fewer than ``rpp`` records.
+
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of pages fetched ahead. Defaults to ``2``.
+        **filters : ContactFilters
+            Filters accepted by :meth:`search_contacts`. ``page`` selects the
+            first page (default ``1``) and ``rpp`` the page size (default
+            ``25``).
+
+        Yields
+        ------
+        Dict[str, Any]
+            Contact records in result order.
+
+        Raises
+        ------
+        ValueError
+            If ``prefetch`` is less than 1.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        return self._iter_results(self.search_contacts, dict(filters), prefetch)
 
-        def to_camel(name: str) -> str:
-            parts = name.split("_")
-            return parts[0] + "".join(p.capitalize() for p in parts[1:])
+    def iter_companies(
+        self, prefetch: int = 2, **filters: Unpack[CompanyFilters]
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all companies matching the filters.
 
-        params = {
-            to_camel(k): v
-            for k, v in locals().items()
-            if k not in {"self", "extra_filters"} and v is not None
-        }
-        params.update(extra_filters)
-        return self._post("/search/company", params)
+        Pages are requested in a background thread pool so that up to
+        ``prefetch`` pages are in flight while the current one is consumed.
+        Iteration stops at the first page with fewer than ``rpp`` records.
 
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of pages fetched ahead. Defaults to ``2``.
+        **filters : CompanyFilters
+            Filters accepted by :meth:`search_companies`. ``page`` selects
+            the first page (default ``1``) and ``rpp`` the page size (default
+            ``25``).
+
+        Yields
+        ------
+        Dict[str, Any]
+            Company records in result order.
+
+        Raises
+        ------
+        ValueError
+            If ``prefetch`` is less than 1.
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        return self._iter_results(self.search_companies, dict(filters), prefetch)